@@ -1,211 +1,323 @@
 """
 Max Profit Solver - Command Line Interface (FIXED VERSION)
 A standalone tool to solve the maximum profit building construction problem.
+
+The module type-checks cleanly, so it can be compiled in place with mypyc:
+  pip install mypy && mypyc max_profit_cli.py
+The resulting extension module is picked up ahead of this file on import.
+
+Batch mode runs once and exits, so interpreter startup dominates. For the fastest
+cold start skip site-packages and debug position tables (Python 3.11+, where
+frozen stdlib modules are already the default):
+  python3 -S -X frozen_modules=on -X no_debug_ranges max_profit_cli.py 20
 """
 
-from typing import Tuple, List, Dict
-import argparse
+from __future__ import annotations
+
+from functools import lru_cache
 import sys
-from datetime import datetime
+
+# Annotations are never evaluated at runtime, so typing (~8 ms to import) is only
+# needed by type checkers and stays off the startup path
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any, Optional, Sequence, Tuple, List, Dict
 
 # Building configurations
-BUILDINGS = {
+BUILDINGS: Dict[str, Dict[str, Any]] = {
     'Theatre': {'time': 5, 'earning': 1500, 'code': 'T'},
     'Pub': {'time': 4, 'earning': 1000, 'code': 'P'},
     'Commercial Park': {'time': 10, 'earning': 3000, 'code': 'C'}
 }
 
-class MaxProfitSolver:
-    def __init__(self):
-        self.memo = {}
+# Building fields as parallel tuples, indexed in the same order as BUILDINGS.
+# Solutions are (theatre, pub, commercial_park) count tuples indexed the same way;
+# names and codes are only looked up for display.
+T_IDX, P_IDX, C_IDX = 0, 1, 2
+_NAMES: Tuple[str, ...] = tuple(BUILDINGS)
+_CODES: Tuple[str, ...] = tuple(config['code'] for config in BUILDINGS.values())
+_INDEX: Dict[str, int] = {name: building_idx for building_idx, name in enumerate(_NAMES)}
+_BUILD_TIMES: Tuple[int, ...] = tuple(config['time'] for config in BUILDINGS.values())
+_EARNINGS: Tuple[int, ...] = tuple(config['earning'] for config in BUILDINGS.values())
+
+# Interactive mode answers
+_QUIT = frozenset({'q', 'quit', 'exit'})
+_YES = frozenset({'y', 'yes'})
+
+def _add_building(solution: Tuple[int, int, int], building_idx: int) -> Tuple[int, int, int]:
+    """Return a copy of a count tuple with one more building at building_idx"""
+    if building_idx == T_IDX:
+        return (solution[T_IDX] + 1, solution[P_IDX], solution[C_IDX])
+    if building_idx == P_IDX:
+        return (solution[T_IDX], solution[P_IDX] + 1, solution[C_IDX])
+    return (solution[T_IDX], solution[P_IDX], solution[C_IDX] + 1)
+
+def _to_solution_dict(solution: Tuple[int, int, int]) -> Dict[str, int]:
+    """Convert a count tuple back to the {building_name: count} form"""
+    return dict(zip(_NAMES, solution))
+
+def _to_plan(solution: Dict[str, int]) -> Tuple[Tuple[int, int], ...]:
+    """
+    Convert a {building_name: count} dict to (building_idx, count) pairs, keeping the
+    dict's order as the build order. Unknown building names raise KeyError.
+    """
+    return tuple((_INDEX[building], count) for building, count in solution.items())
+
+def _dp_profits(time_units: int, build_times: Tuple[int, ...], earnings: Tuple[int, ...]) -> List[int]:
+    """
+    Profit-only DP: dp[t] = maximum profit using buildings that finish by time t
+    Pure integer arithmetic - no solution bookkeeping happens here
+    """
+    dp = [0] * (time_units + 1)
     
-    def solve_dp_all_solutions(self, time_units: int) -> Tuple[int, List[Dict[str, int]]]:
-        """
-        Dynamic Programming solution to find maximum profit and ALL optimal solutions
-        Key insight: Building earns money for each period it's operational after construction
+    for t in range(1, time_units + 1):
+        max_profit = dp[t-1]  # Do nothing
         
-        FIXED: Only include buildings that actually earn money (operational_periods > 0)
-        """
-        # dp[i] = (max_profit, list_of_all_optimal_solutions)
-        dp = [(0, [{'Theatre': 0, 'Pub': 0, 'Commercial Park': 0}] )] * (time_units + 1)
-        
-        for t in range(1, time_units + 1):
-            max_profit = dp[t-1][0]
-            best_solutions = list(dp[t-1][1])  # Copy previous solutions (do nothing)
+        for building_idx in range(len(build_times)):
+            build_time = build_times[building_idx]
             
-            for building, config in BUILDINGS.items():
-                build_time = config['time']
-                earning = config['earning']
+            if t >= build_time:
+                # Building finishes construction at time t
+                # It earns for periods (t+1, t+2, ..., time_units) => (time_units - t) periods
+                operational_periods = time_units - t
                 
-                if t >= build_time:
-                    # Building finishes construction at time t
-                    # It earns for periods (t+1, t+2, ..., time_units) => (time_units - t) periods
-                    operational_periods = time_units - t
-                    total_earning = earning * operational_periods
-                    
-                    # FIX: Only consider buildings that will actually earn money
-                    if operational_periods > 0 and total_earning > 0:
-                        prev_profit, prev_solutions = dp[t - build_time]
-                        new_profit = prev_profit + total_earning
-                        
-                        if new_profit > max_profit:
-                            max_profit = new_profit
-                            best_solutions = []
-                            for prev_solution in prev_solutions:
-                                new_solution = prev_solution.copy()
-                                new_solution[building] += 1
-                                best_solutions.append(new_solution)
-                        elif new_profit == max_profit:
-                            for prev_solution in prev_solutions:
-                                new_solution = prev_solution.copy()
-                                new_solution[building] += 1
-                                # FIX: Ensure we don't add duplicate solutions
-                                if new_solution not in best_solutions:
-                                    best_solutions.append(new_solution)
-            
-            dp[t] = (max_profit, best_solutions)
+                # FIX: Only consider buildings that will actually earn money
+                if operational_periods > 0:
+                    new_profit = dp[t - build_time] + earnings[building_idx] * operational_periods
+                    if new_profit > max_profit:
+                        max_profit = new_profit
         
-        return dp[time_units]
+        dp[t] = max_profit
+    
+    return dp
+
+def _optimal_builds(t: int, time_units: int, dp: List[int], build_times: Tuple[int, ...],
+                    earnings: Tuple[int, ...]) -> List[int]:
+    """Indices of buildings whose construction finishing at time t reaches exactly dp[t]"""
+    operational_periods = time_units - t
+    if operational_periods <= 0:
+        return []
+    return [building_idx for building_idx in range(len(build_times))
+            if t >= build_times[building_idx]
+            and dp[t - build_times[building_idx]] + earnings[building_idx] * operational_periods == dp[t]]
+
+def _trace_solutions(time_units: int, dp: List[int], build_times: Tuple[int, ...],
+                     earnings: Tuple[int, ...]) -> List[Tuple[int, int, int]]:
+    """
+    Rebuild ALL optimal solutions reachable backward from dp[time_units]
+    A predecessor is followed only if it reaches exactly dp[t]
+    """
+    # Walk backward once to mark the cells an optimal solution can pass through...
+    reachable = [False] * (time_units + 1)
+    reachable[time_units] = True
+    builds: List[List[int]] = [[] for _ in range(time_units + 1)]
+    for t in range(time_units, 0, -1):
+        if reachable[t]:
+            if dp[t-1] == dp[t]:
+                reachable[t-1] = True
+            builds[t] = _optimal_builds(t, time_units, dp, build_times, earnings)
+            for building_idx in builds[t]:
+                reachable[t - build_times[building_idx]] = True
+    
+    # ...then fill only those cells from t=0 upward, so every predecessor is ready
+    # before it is read and long horizons never recurse
+    solutions: List[Tuple[Tuple[int, int, int], ...]] = [()] * (time_units + 1)
+    solutions[0] = ((0, 0, 0),)
+    for t in range(1, time_units + 1):
+        if reachable[t]:
+            solutions[t] = _solutions_at(t, dp, build_times, builds[t], solutions)
+    
+    return list(solutions[time_units])
+
+def _solutions_at(t: int, dp: List[int], build_times: Tuple[int, ...], builds: List[int],
+                  solutions: List[Tuple[Tuple[int, int, int], ...]]) -> Tuple[Tuple[int, int, int], ...]:
+    """All optimal solutions reaching dp[t] via builds, given the filled cells of solutions below t"""
+    if dp[t-1] == dp[t]:
+        # Share previous solutions (do nothing); they are only copied if a building adds to them
+        carried = solutions[t-1]
+    else:
+        carried = ()
+    
+    # Ordered set of count tuples: build orders that reach the same counts collapse
+    # into one entry for every source, while first-seen order keeps the output stable
+    best_solutions: Optional[Dict[Tuple[int, int, int], None]] = None
+    
+    for building_idx in builds:
+        if best_solutions is None:
+            best_solutions = dict.fromkeys(carried)
+        for prev_solution in solutions[t - build_times[building_idx]]:
+            best_solutions[_add_building(prev_solution, building_idx)] = None
+    
+    return carried if best_solutions is None else tuple(best_solutions)
+
+@lru_cache(maxsize=128)
+def _solve_all_solutions(time_units: int) -> Tuple[int, Tuple[Tuple[int, int, int], ...]]:
+    """
+    Dynamic Programming solution to find maximum profit and ALL optimal solutions
+    Key insight: Building earns money for each period it's operational after construction
+    
+    Runs in two phases: an integer profit DP, then a trace of the optimal solutions.
+    Results are cached per time_units, so repeated queries skip the DP entirely.
+    """
+    dp = _dp_profits(time_units, _BUILD_TIMES, _EARNINGS)
+    return dp[time_units], tuple(_trace_solutions(time_units, dp, _BUILD_TIMES, _EARNINGS))
+
+def _block_profit(time_units: int, start_time: int, count: int, build_time: int, earning: int) -> int:
+    """
+    Profit of `count` identical buildings built back to back from start_time
+    Closed form of earning * sum(max(0, time_units - (start_time + i * build_time))) for i = 1..count
+    """
+    # Buildings finishing at or after time_units earn nothing
+    earning_count = max(0, min(count, (time_units - start_time) // build_time))
+    return earning * (earning_count * (time_units - start_time)
+                      - build_time * earning_count * (earning_count + 1) // 2)
+
+@lru_cache(maxsize=1024)
+def _validate_solution(time_units: int, plan: Tuple[Tuple[int, int], ...]) -> Tuple[bool, int, str]:
+    """
+    Validate a build plan of (building_idx, count) pairs, building in the given order
+    Returns: (is_valid, calculated_profit, message)
+    """
+    total_profit = 0
+    current_time = 0
+    
+    for building_idx, count in plan:
+        if count > 0:
+            build_time = _BUILD_TIMES[building_idx]
+            earning_per_period = _EARNINGS[building_idx]
+            
+            total_profit += _block_profit(time_units, current_time, count, build_time, earning_per_period)
+            current_time += count * build_time
+    
+    total_time_used = current_time
+    is_valid = total_time_used <= time_units
+    message = f"Time used: {total_time_used}/{time_units}, Profit: ${total_profit:,}"
+    
+    return is_valid, total_profit, message
+
+class MaxProfitSolver:
+    """Stateless facade over the module-level solvers"""
+    __slots__ = ()
+    
+    def solve_dp_all_solutions(self, time_units: int) -> Tuple[int, List[Dict[str, int]]]:
+        """
+        Find maximum profit and ALL optimal solutions for the given time units
+        Returns: (max_profit, list_of_solutions)
+        """
+        max_profit, solutions = _solve_all_solutions(time_units)
+        return max_profit, [_to_solution_dict(solution) for solution in solutions]
     
     def calculate_profit(self, time_units: int, solution: Dict[str, int]) -> int:
         """Calculate the total profit for a given solution"""
-        total_profit = 0
-        current_time = 0
-        
-        for building, count in solution.items():
-            if count > 0:
-                config = BUILDINGS[building]
-                build_time = config['time']
-                earning_per_period = config['earning']
-                
-                for _ in range(count):
-                    construction_end_time = current_time + build_time
-                    current_time = construction_end_time
-                    operational_periods = time_units - construction_end_time
-                    if operational_periods > 0:
-                        building_profit = earning_per_period * operational_periods
-                        total_profit += building_profit
-        
-        return total_profit
+        return _validate_solution(time_units, _to_plan(solution))[1]
     
     def validate_solution(self, time_units: int, solution: Dict[str, int]) -> Tuple[bool, int, str]:
         """
         Validate if the solution is correct
         Returns: (is_valid, calculated_profit, message)
         """
-        total_profit = 0
-        current_time = 0
-        
-        for building, count in solution.items():
-            if count > 0:
-                config = BUILDINGS[building]
-                build_time = config['time']
-                earning_per_period = config['earning']
-                
-                for _ in range(count):
-                    construction_end_time = current_time + build_time
-                    current_time = construction_end_time
-                    operational_periods = time_units - construction_end_time
-                    if operational_periods > 0:
-                        building_profit = earning_per_period * operational_periods
-                        total_profit += building_profit
-        
-        total_time_used = current_time
-        is_valid = total_time_used <= time_units
-        message = f"Time used: {total_time_used}/{time_units}, Profit: ${total_profit:,}"
-        
-        return is_valid, total_profit, message
+        return _validate_solution(time_units, _to_plan(solution))
+
+def _format_counts(solution: Tuple[int, int, int]) -> str:
+    """Format a count tuple as 'T: 1 P: 0 C: 0' format"""
+    return (f"{_CODES[T_IDX]}: {solution[T_IDX]} {_CODES[P_IDX]}: {solution[P_IDX]} "
+            f"{_CODES[C_IDX]}: {solution[C_IDX]}")
 
 def format_solution(solution: Dict[str, int]) -> str:
     """Format solution as 'T: 1 P: 0 C: 0' format"""
-    codes = []
-    for building in ['Theatre', 'Pub', 'Commercial Park']:
-        code = BUILDINGS[building]['code']
-        count = solution[building]
-        codes.append(f"{code}: {count}")
-    return " ".join(codes)
+    return _format_counts((solution[_NAMES[T_IDX]], solution[_NAMES[P_IDX]], solution[_NAMES[C_IDX]]))
 
-def print_header():
-    """Print application header"""
-    print("=" * 80)
-    print("🏗️  MAXIMUM PROFIT BUILDING CONSTRUCTION SOLVER (FIXED)")
-    print("=" * 80)
-    print("Building Types:")
+def write_lines(out: List[str]):
+    """Write buffered output lines to stdout in a single call"""
+    if out:
+        sys.stdout.write("\n".join(out) + "\n")
+        sys.stdout.flush()
+
+def print_header(out: List[str]):
+    """Append application header lines to out"""
+    out.append("=" * 80)
+    out.append("🏗️  MAXIMUM PROFIT BUILDING CONSTRUCTION SOLVER (FIXED)")
+    out.append("=" * 80)
+    out.append("Building Types:")
     for building, config in BUILDINGS.items():
-        print(f"  • {building} ({config['code']}): {config['time']} time units, ${config['earning']:,}/period")
-    print("=" * 80)
+        out.append(f"  • {building} ({config['code']}): {config['time']} time units, ${config['earning']:,}/period")
+    out.append("=" * 80)
 
-def print_solution_details(time_units: int, solution: Dict[str, int], solution_idx: int, solver: MaxProfitSolver):
-    """Print detailed information about a specific solution"""
-    print(f"\n📋 SOLUTION #{solution_idx + 1}")
-    print("-" * 40)
+def print_solution_details(time_units: int, solution: Tuple[int, int, int], solution_idx: int, out: List[str]):
+    """Append detailed information about a specific solution to out"""
+    out.append(f"\n📋 SOLUTION #{solution_idx + 1}")
+    out.append("-" * 40)
     
     # Format solution
-    formatted = format_solution(solution)
-    print(f"Building Configuration: {formatted}")
+    formatted = _format_counts(solution)
+    out.append(f"Building Configuration: {formatted}")
     
     # Validate and get details
-    is_valid, calculated_profit, message = solver.validate_solution(time_units, solution)
-    print(f"Validation: {'✅ Valid' if is_valid else '❌ Invalid'}")
-    print(f"Details: {message}")
+    is_valid, calculated_profit, message = _validate_solution(time_units, tuple(enumerate(solution)))
+    out.append(f"Validation: {'✅ Valid' if is_valid else '❌ Invalid'}")
+    out.append(f"Details: {message}")
     
-    # Show construction timeline
-    print("\n🏗️  Construction Timeline:")
+    # Show construction timeline; this is the only place the per-building trace is built
+    out.append("\n🏗️  Construction Timeline:")
     current_time = 0
     total_profit_check = 0
     
-    for building, count in solution.items():
+    for building_idx, count in enumerate(solution):
         if count > 0:
-            build_time = BUILDINGS[building]['time']
+            building = _NAMES[building_idx]
+            build_time = _BUILD_TIMES[building_idx]
+            period_earning = _EARNINGS[building_idx]
+            earns_text = f"(Earns ${period_earning:,}/period for"
             for i in range(count):
                 start_time = current_time
                 end_time = current_time + build_time
                 operational_periods = time_units - end_time
-                period_earning = BUILDINGS[building]['earning']
                 total_earning = period_earning * operational_periods if operational_periods > 0 else 0
                 
-                print(f"  {building} #{i+1}: Time {start_time}-{end_time} "
-                      f"(Earns ${period_earning:,}/period for {operational_periods} periods = ${total_earning:,})")
+                out.append(f"  {building} #{i+1}: Time {start_time}-{end_time} "
+                           f"{earns_text} {operational_periods} periods = ${total_earning:,})")
                 current_time = end_time
                 total_profit_check += total_earning
     
     if current_time == 0:
-        print("  No buildings constructed")
+        out.append("  No buildings constructed")
     
-    print(f"\n💰 Total Profit Verification: ${total_profit_check:,}")
+    out.append(f"\n💰 Total Profit Verification: ${total_profit_check:,}")
 
-def print_summary(time_units: int, max_profit: int, solutions: List[Dict[str, int]], solver: MaxProfitSolver):
-    """Print summary of all solutions"""
-    print(f"\n📊 SUMMARY")
-    print("=" * 80)
-    print(f"Time Units Available: {time_units}")
-    print(f"Maximum Profit: ${max_profit:,}")
-    print(f"Number of Optimal Solutions: {len(solutions)}")
+def print_summary(time_units: int, max_profit: int, solutions: Sequence[Tuple[int, int, int]], out: List[str]):
+    """Append summary of all solutions to out"""
+    out.append(f"\n📊 SUMMARY")
+    out.append("=" * 80)
+    out.append(f"Time Units Available: {time_units}")
+    out.append(f"Maximum Profit: ${max_profit:,}")
+    out.append(f"Number of Optimal Solutions: {len(solutions)}")
     
     if len(solutions) > 1:
-        print(f"\n🏆 All Optimal Solutions:")
+        out.append(f"\n🏆 All Optimal Solutions:")
         for i, solution in enumerate(solutions):
-            formatted = format_solution(solution)
-            is_valid, calculated_profit, _ = solver.validate_solution(time_units, solution)
+            formatted = _format_counts(solution)
+            is_valid, calculated_profit, _ = _validate_solution(time_units, tuple(enumerate(solution)))
             status = "✅" if is_valid else "❌"
-            print(f"  {status} Solution {i+1}: {formatted} (Profit: ${calculated_profit:,})")
+            out.append(f"  {status} Solution {i+1}: {formatted} (Profit: ${calculated_profit:,})")
     else:
-        print(f"\n🏆 Optimal Solution:")
-        formatted = format_solution(solutions[0])
-        is_valid, calculated_profit, _ = solver.validate_solution(time_units, solutions[0])
+        out.append(f"\n🏆 Optimal Solution:")
+        formatted = _format_counts(solutions[0])
+        is_valid, calculated_profit, _ = _validate_solution(time_units, tuple(enumerate(solutions[0])))
         status = "✅" if is_valid else "❌"
-        print(f"  {status} {formatted} (Profit: ${calculated_profit:,})")
+        out.append(f"  {status} {formatted} (Profit: ${calculated_profit:,})")
 
 def interactive_mode():
     """Run the solver in interactive mode"""
-    print_header()
+    out = []
+    print_header(out)
+    write_lines(out)
     
     while True:
         try:
             print(f"\n⏰ Enter time units (1-100, or 'q' to quit): ", end="")
-            user_input = input().strip()
+            user_input = input().strip().lower()
             
-            if user_input.lower() in ['q', 'quit', 'exit']:
+            if user_input in _QUIT:
                 print("\n👋 Goodbye!")
                 break
             
@@ -216,19 +328,22 @@ def interactive_mode():
             
             # Solve the problem
             print(f"\n🔍 Solving for {time_units} time units...")
-            solver = MaxProfitSolver()
-            max_profit, all_solutions = solver.solve_dp_all_solutions(time_units)
+            max_profit, all_solutions = _solve_all_solutions(time_units)
             
             # Print results
-            print_summary(time_units, max_profit, all_solutions, solver)
+            out = []
+            print_summary(time_units, max_profit, all_solutions, out)
+            write_lines(out)
             
             # Ask if user wants detailed view
             if len(all_solutions) > 0:
                 print(f"\n📋 Show detailed breakdown? (y/n): ", end="")
                 show_details = input().strip().lower()
-                if show_details in ['y', 'yes']:
+                if show_details in _YES:
+                    out = []
                     for i, solution in enumerate(all_solutions):
-                        print_solution_details(time_units, solution, i, solver)
+                        print_solution_details(time_units, solution, i, out)
+                    write_lines(out)
             
             print("\n" + "=" * 80)
             
@@ -242,22 +357,53 @@ def interactive_mode():
 
 def batch_mode(time_units: int, detailed: bool = False):
     """Run the solver for a specific time value"""
-    print_header()
+    out: List[str] = []
+    print_header(out)
     
-    print(f"\n⏰ Time Units: {time_units}")
-    print(f"🔍 Solving...")
+    out.append(f"\n⏰ Time Units: {time_units}")
+    out.append(f"🔍 Solving...")
     
-    solver = MaxProfitSolver()
-    max_profit, all_solutions = solver.solve_dp_all_solutions(time_units)
+    max_profit, all_solutions = _solve_all_solutions(time_units)
     
-    print_summary(time_units, max_profit, all_solutions, solver)
+    print_summary(time_units, max_profit, all_solutions, out)
     
     if detailed and len(all_solutions) > 0:
         for i, solution in enumerate(all_solutions):
-            print_solution_details(time_units, solution, i, solver)
+            print_solution_details(time_units, solution, i, out)
+    
+    write_lines(out)
 
-def main():
-    """Main function to handle command line arguments and run the solver"""
+def parse_fast_args(argv: List[str]) -> Optional[Tuple[Optional[int], bool]]:
+    """
+    Parse the common '[time_units] [--detailed]' forms without argparse
+    Returns: (time_units or None for interactive mode, detailed), or None if argparse is needed
+    """
+    if not argv:
+        return None, False
+    if len(argv) > 2:
+        return None
+    
+    detailed = False
+    time_units = None
+    for arg in argv:
+        if arg == '--detailed' and not detailed:
+            detailed = True
+        elif time_units is None:
+            try:
+                time_units = int(arg)
+            except ValueError:
+                return None
+        else:
+            return None
+    
+    if time_units is None:
+        return None
+    return time_units, detailed
+
+def parse_args(argv: List[str]) -> Tuple[Optional[int], bool]:
+    """Full argparse parsing, used for --help, --version and invalid input"""
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="Maximum Profit Building Construction Solver (FIXED)",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -289,19 +435,27 @@ Examples:
         version='Max Profit Solver v1.1 (Fixed)'
     )
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+    return args.time_units, args.detailed
+
+def main():
+    """Main function to handle command line arguments and run the solver"""
+    # argparse is only imported when the fast path can't handle the arguments
+    argv = sys.argv[1:]
+    parsed = parse_fast_args(argv)
+    time_units, detailed = parsed if parsed is not None else parse_args(argv)
     
     try:
-        if args.time_units is None:
+        if time_units is None:
             # Interactive mode
             interactive_mode()
         else:
             # Batch mode
-            if args.time_units < 1 or args.time_units > 100:
+            if time_units < 1 or time_units > 100:
                 print("❌ Error: Time units must be between 1 and 100.")
                 sys.exit(1)
             
-            batch_mode(args.time_units, args.detailed)
+            batch_mode(time_units, detailed)
             
     except KeyboardInterrupt:
         print("\n\n👋 Goodbye!")